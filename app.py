@@ -1,9 +1,12 @@
 from datetime import date, timedelta
+import hashlib
+import time
 
 import streamlit as st
 
-from major_report_pipeline import run_major_paid_increase_report_bytes
-from ri_pipeline import run_rights_issue_report_bytes
+from dart_common import range_closed_at
+from major_report_pipeline import major_report_filename, run_major_paid_increase_report_bytes
+from ri_pipeline import rights_issue_report_filename, run_rights_issue_report_bytes
 
 
 st.set_page_config(
@@ -67,11 +70,52 @@ def _get_api_key() -> str:
     return st.secrets["DART_API_KEY"]
 
 
+def _hash_api_key(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+class _EmptyReport(Exception):
+    pass
+
+
+# 밑줄로 시작하는 인자는 캐시 키에서 제외되므로 API 키는 해시값으로만 캐시 키에 반영된다.
+# 파일명의 추출시간은 캐시된 결과와 무관하게 다운로드 시점에 다시 만든다.
+# 예외는 캐시되지 않으므로 결과가 없으면 _EmptyReport를 던져 다음 실행에서 다시 조회한다.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_rights_issue_report(_api_key: str, api_key_hash: str, bgn_de: str, end_de: str, _refresh: bool = False):
+    result = run_rights_issue_report_bytes(api_key=_api_key, bgn_de=bgn_de, end_de=end_de, refresh=_refresh)
+    if not result:
+        raise _EmptyReport
+    return result[0]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_major_report(_api_key: str, api_key_hash: str, bgn_de: str, end_de: str, _refresh: bool = False):
+    result = run_major_paid_increase_report_bytes(api_key=_api_key, bgn_de=bgn_de, end_de=end_de, refresh=_refresh)
+    if not result:
+        raise _EmptyReport
+    return result[0]
+
+
+def _run_report(cached_fn, api_key: str, bgn_de: str, end_de: str, refresh: bool):
+    # 종료일자 당일이 끝나지 않은 구간은 공시가 계속 추가되므로 메모하지 않는다.
+    # 이 경우에도 DART 응답은 파이프라인의 파일 캐시에서 짧은 TTL로만 재사용된다.
+    if time.time() < range_closed_at(end_de):
+        cached_fn = cached_fn.__wrapped__
+    elif refresh:
+        cached_fn.clear()
+    try:
+        return cached_fn(api_key, _hash_api_key(api_key), bgn_de, end_de, _refresh=refresh)
+    except _EmptyReport:
+        return None
+
+
 tabs = st.tabs(["유상증자", "주식연계채권 등"])
 
 with tabs[0]:
     api_key = _get_api_key()
     bgn_date, end_date = _render_date_inputs("rights")
+    refresh = st.checkbox("캐시 무시하고 새로 조회", key="rights_refresh")
 
     if st.button("실행", type="primary", key="run_rights"):
         if not api_key:
@@ -79,20 +123,17 @@ with tabs[0]:
         elif bgn_date > end_date:
             st.error("시작일자는 종료일자보다 이후일 수 없습니다.")
         else:
+            bgn_de = bgn_date.strftime("%Y%m%d")
+            end_de = end_date.strftime("%Y%m%d")
             with st.spinner("조회 중..."):
-                result = run_rights_issue_report_bytes(
-                    api_key=api_key,
-                    bgn_de=bgn_date.strftime("%Y%m%d"),
-                    end_de=end_date.strftime("%Y%m%d"),
-                )
+                data = _run_report(_cached_rights_issue_report, api_key, bgn_de, end_de, refresh)
 
-            if result:
-                data, filename = result
+            if data:
                 st.success("완료")
                 st.download_button(
                     "엑셀 다운로드",
                     data=data,
-                    file_name=filename,
+                    file_name=rights_issue_report_filename(bgn_de, end_de),
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     key="download_rights",
                 )
@@ -102,6 +143,7 @@ with tabs[0]:
 with tabs[1]:
     api_key = _get_api_key()
     bgn_date, end_date = _render_date_inputs("major")
+    refresh = st.checkbox("캐시 무시하고 새로 조회", key="major_refresh")
 
     if st.button("실행", type="primary", key="run_major"):
         if not api_key:
@@ -109,20 +151,17 @@ with tabs[1]:
         elif bgn_date > end_date:
             st.error("시작일자는 종료일자보다 이후일 수 없습니다.")
         else:
+            bgn_de = bgn_date.strftime("%Y%m%d")
+            end_de = end_date.strftime("%Y%m%d")
             with st.spinner("조회 중..."):
-                result = run_major_paid_increase_report_bytes(
-                    api_key=api_key,
-                    bgn_de=bgn_date.strftime("%Y%m%d"),
-                    end_de=end_date.strftime("%Y%m%d"),
-                )
+                data = _run_report(_cached_major_report, api_key, bgn_de, end_de, refresh)
 
-            if result:
-                data, filename = result
+            if data:
                 st.success("완료")
                 st.download_button(
                     "엑셀 다운로드",
                     data=data,
-                    file_name=filename,
+                    file_name=major_report_filename(bgn_de, end_de),
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     key="download_major",
                 )
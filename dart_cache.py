@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import gzip
+import hashlib
+import os
+import threading
+import time
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "dart"
+# 어떤 TTL로도 다시 쓰이지 않을 만큼 오래된 파일은 정리한다.
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+PRUNE_INTERVAL = 60 * 60
+
+# API 키는 응답 내용에 영향을 주지 않으므로 캐시 키에서 제외한다.
+_IGNORED_PARAMS = {"crtfc_key"}
+
+
+class FileCache:
+    def __init__(self, root: str | Path = DEFAULT_CACHE_DIR, max_age_seconds: float = DEFAULT_MAX_AGE):
+        self.root = Path(root)
+        self.max_age_seconds = max_age_seconds
+        self._last_prune = 0.0
+        self._prune_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: dict[str, str]) -> str:
+        items = sorted((k, str(v)) for k, v in params.items() if k not in _IGNORED_PARAMS)
+        raw = url + "?" + "&".join(f"{k}={v}" for k, v in items)
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, url: str, params: dict[str, str]) -> Path:
+        endpoint, _, ext = url.rstrip("/").rsplit("/", 1)[-1].partition(".")
+        suffix = ".zip" if ext == "xml" else f".{ext}.gz"
+        return self.root / endpoint / f"{self.make_key(url, params)}{suffix}"
+
+    def get(
+        self,
+        url: str,
+        params: dict[str, str],
+        ttl_seconds: float | Callable[[float], float],
+    ) -> bytes | None:
+        # ttl_seconds에 함수를 주면 저장 시각(mtime)에 따라 TTL을 정한다.
+        path = self._path(url, params)
+        try:
+            mtime = path.stat().st_mtime
+            ttl = ttl_seconds(mtime) if callable(ttl_seconds) else ttl_seconds
+            if time.time() - mtime > ttl:
+                path.unlink(missing_ok=True)
+                return None
+            data = path.read_bytes()
+            return gzip.decompress(data) if path.suffix == ".gz" else data
+        except (OSError, EOFError):
+            return None
+
+    def set(self, url: str, params: dict[str, str], data: bytes) -> None:
+        path = self._path(url, params)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(gzip.compress(data) if path.suffix == ".gz" else data)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+        self._maybe_prune()
+
+    def _maybe_prune(self) -> None:
+        now = time.time()
+        with self._prune_lock:
+            if now - self._last_prune < PRUNE_INTERVAL:
+                return
+            self._last_prune = now
+        self.prune()
+
+    def prune(self) -> None:
+        cutoff = time.time() - self.max_age_seconds
+        for path in self.root.rglob("*"):
+            try:
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+            except OSError:
+                continue
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+import threading
+
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from dart_cache import FileCache
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson이 없으면 표준 json으로 파싱한다.
+    from json import loads as json_loads
+
+
+MAX_WORKERS = 8
+
+# 두 파이프라인이 함께 쓰는 DART 동시 요청 제한. 스레드 수와 관계없이 MAX_WORKERS를 넘지 않는다.
+REQUEST_SLOTS = threading.Semaphore(MAX_WORKERS)
+
+# 두 파이프라인이 같은 캐시 디렉터리와 저장 규칙을 쓰도록 캐시는 여기서만 다룬다.
+_CACHE = FileCache()
+
+_SESSION_HEADERS = {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive", "User-Agent": "wm-dart/1.0"}
+
+
+def range_closed_at(end_de: str) -> float:
+    # end_de 다음 날 0시(KST). 이 시각 이전에 받은 응답에는 end_de 당일 공시가 빠져 있을 수 있다.
+    end = datetime.strptime(end_de, "%Y%m%d").replace(tzinfo=ZoneInfo("Asia/Seoul"))
+    return (end + timedelta(days=1)).timestamp()
+
+
+def new_session(pool_connections: int, pool_maxsize: int, max_retries: Retry) -> requests.Session:
+    session = requests.Session()
+    session.headers.update(_SESSION_HEADERS)
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries),
+    )
+    return session
+
+
+def dart_get(
+    session: requests.Session,
+    url: str,
+    params: dict[str, str],
+    timeout: int,
+    verify_ssl: bool = True,
+) -> requests.Response:
+    with REQUEST_SLOTS:
+        resp = session.get(url, params=params, timeout=timeout, verify=verify_ssl)
+    resp.raise_for_status()
+    return resp
+
+
+def cached_get(
+    session: requests.Session,
+    url: str,
+    params: dict[str, str],
+    timeout: int,
+    ttl_seconds: float | Callable[[float], float],
+    refresh: bool = False,
+    cacheable: Callable[[bytes], bool] | None = None,
+    verify_ssl: bool = True,
+) -> bytes:
+    if not refresh:
+        cached = _CACHE.get(url, params, ttl_seconds)
+        if cached is not None:
+            return cached
+
+    content = dart_get(session, url, params, timeout, verify_ssl=verify_ssl).content
+    if cacheable is None or cacheable(content):
+        _CACHE.set(url, params, content)
+    return content
+
+
+def _is_cacheable_json(url: str, content: bytes) -> bool:
+    # 정상(000)과 조회 결과 없음(013)만 저장해 실패한 요청은 다음 실행에서 다시 조회한다.
+    # 단, list.json의 013은 이후 올라온 공시를 놓치지 않도록 저장하지 않는다.
+    try:
+        status = str(json_loads(content).get("status"))
+    except ValueError:
+        return False
+    return status == "000" or (status == "013" and not url.endswith("/list.json"))
+
+
+def get_json(
+    session: requests.Session,
+    url: str,
+    params: dict[str, str],
+    timeout: int,
+    ttl_seconds: float | Callable[[float], float] = 0,
+    refresh: bool = False,
+    verify_ssl: bool = True,
+) -> dict:
+    if not ttl_seconds:
+        return json_loads(dart_get(session, url, params, timeout, verify_ssl=verify_ssl).content)
+    content = cached_get(
+        session,
+        url,
+        params,
+        timeout,
+        ttl_seconds,
+        refresh=refresh,
+        cacheable=lambda data: _is_cacheable_json(url, data),
+        verify_ssl=verify_ssl,
+    )
+    return json_loads(content)
+
+
+def write_sheet(
+    writer: pd.ExcelWriter,
+    df: pd.DataFrame,
+    sheet_name: str,
+    col_formats: dict[str, tuple[float, dict | None]],
+):
+    wb = writer.book
+    ws = wb.add_worksheet(sheet_name)
+    header_fmt = wb.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+
+    col_fmts: dict[tuple, object] = {}
+    for col_name, (width, fmt_props) in col_formats.items():
+        if col_name in df.columns:
+            idx = df.columns.get_loc(col_name)
+            fmt = None
+            if fmt_props:
+                key = tuple(sorted(fmt_props.items()))
+                if key not in col_fmts:
+                    col_fmts[key] = wb.add_format(fmt_props)
+                fmt = col_fmts[key]
+            ws.set_column(idx, idx, width, fmt)
+
+    # constant_memory 모드는 행 단위로 순서대로만 기록할 수 있어 df.to_excel을 사용하지 않는다.
+    ws.write_row(0, 0, list(df.columns), header_fmt)
+
+    writers = [
+        ws.write_url
+        if col == "URL"
+        else ws.write_number
+        if is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+        else ws.write
+        for col, dtype in df.dtypes.items()
+    ]
+    cells = df.astype(object).where(df.notna(), None)
+    for row_idx, values in enumerate(cells.itertuples(index=False, name=None), start=1):
+        for col_idx, (write, value) in enumerate(zip(writers, values)):
+            if value is not None:
+                write(row_idx, col_idx, value)
+    return ws
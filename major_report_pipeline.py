@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 from zoneinfo import ZoneInfo
-import html
 import io
 import re
-import time
 import warnings
 import zipfile
 
 from dateutil.relativedelta import relativedelta
+from lxml import etree
 import numpy as np
 import pandas as pd
-import requests
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from urllib3.util.retry import Retry
+
+from dart_common import MAX_WORKERS, cached_get, get_json, new_session, range_closed_at, write_sheet
 
 
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
@@ -25,6 +29,15 @@ BW_API_URL = "https://opendart.fss.or.kr/api/bdwtIsDecsn.json"
 COMPANY_API_URL = "https://opendart.fss.or.kr/api/company.json"
 DOC_API_URL = "https://opendart.fss.or.kr/api/document.xml"
 
+_SESSION = new_session(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+
+LIST_CACHE_TTL = 24 * 60 * 60
+DECISION_CACHE_TTL = 24 * 60 * 60
+COMPANY_CACHE_TTL = 24 * 60 * 60
+DOC_CACHE_TTL = 30 * 24 * 60 * 60
+# end_de 당일이 끝나기 전에 받은 응답은 이후 공시가 더 추가되므로 짧게만 캐시한다.
+OPEN_RANGE_CACHE_TTL = 10 * 60
+
 PAID_INCREASE_REPORT_TITLES = {
     "주요사항보고서(유상증자결정)",
 }
@@ -40,6 +53,18 @@ BW_REPORT_TITLES = {
 
 TARGET_REPORT_TITLES = PAID_INCREASE_REPORT_TITLES | CB_REPORT_TITLES | BW_REPORT_TITLES
 
+LIST_COLUMNS = [
+    "corp_cls",
+    "corp_name",
+    "corp_code",
+    "stock_code",
+    "report_nm",
+    "rcept_no",
+    "flr_nm",
+    "rcept_dt",
+    "rm",
+]
+
 OUT_RENAME_MAP = {
     "corp_name": "회사명",
     "bizr_no": "사업자등록번호",
@@ -86,24 +111,47 @@ CB_BW_OUT_COLUMNS = [
     "URL",
 ]
 
+REPORT_FIELD_COLUMNS = [
+    "대표이사",
+    "본점소재지",
+    "작성책임자_직책",
+    "작성책임자_성명",
+    "작성책임자_전화번호",
+    "납입일",
+    "신주상장예정일",
+]
+
+
+_RE_BRACKET_PREFIX = re.compile(r"^\s*(\[[^\]]+\]\s*)+")
+_RE_WS = re.compile(r"\s+")
+_RE_DATE_SEP = re.compile(r"[.\-/]")
+_RE_YMD = re.compile(r"\d{8}")
+_RE_LABEL_NOISE = re.compile(r"[\s:()]")
+# 라벨은 셀 어디에 있어도 찾고, 값은 같은 줄의 다음 라벨 앞에서 끊는다.
+_RE_WRITER = re.compile(
+    r"\(? *(직 *책|성 *명|전 *화(?: *번 *호)?) *\)? *:? *((?:(?!\(? *(?:직 *책|성 *명|전 *화))[^\n])*)"
+)
+_RE_PYM_LABEL = re.compile(r"납입일$")
+_RE_LST_LABEL = re.compile(r"신주의\s*상장\s*예정일$")
+
 
 def normalize_report_nm(report_nm: str) -> str:
     s = str(report_nm)
-    s = re.sub(r"^\s*(\[[^\]]+\]\s*)+", "", s)
+    s = _RE_BRACKET_PREFIX.sub("", s)
     return s.strip()
 
 
 def is_third_party_allotment(method: str) -> bool:
-    normalized = re.sub(r"\s+", "", str(method))
+    normalized = _RE_WS.sub("", str(method))
     return "제3자배정" in normalized and "증자" in normalized
 
 
-def to_numeric_series(series: pd.Series) -> pd.Series:
-    return (
-        series.replace("-", "0")
-        .replace(",", "", regex=True)
-        .pipe(pd.to_numeric, errors="coerce")
-        .fillna(0)
+def _coerce_numeric(series: pd.Series) -> pd.Series:
+    if is_numeric_dtype(series) and not is_bool_dtype(series):
+        return series
+    return pd.to_numeric(
+        series.astype(str).str.replace(",", "", regex=False).replace({"-": None}),
+        errors="coerce",
     )
 
 
@@ -119,14 +167,20 @@ def normalize_numeric_series(series: pd.Series) -> pd.Series:
 
 def normalize_date_series(series: pd.Series) -> pd.Series:
     s = series.astype(str).str.strip()
-    s = s.str.replace(r"[.\-/]", "", regex=True)
-    s = s.str.replace(r"\s+", "", regex=True)
+    s = s.str.replace(_RE_DATE_SEP, "", regex=True)
+    s = s.str.replace(_RE_WS, "", regex=True)
     s = (
         s.str.replace("년", "", regex=False)
         .str.replace("월", "", regex=False)
         .str.replace("일", "", regex=False)
     )
-    return s.where(s.str.fullmatch(r"\d{8}", na=False), "")
+    return s.where(s.str.fullmatch(_RE_YMD, na=False), "")
+
+
+def _range_cache_ttl(end_de: str, ttl_seconds: float) -> Callable[[float], float]:
+    # 구간이 닫히기 전에 저장된 응답은 조회 시점과 관계없이 짧은 TTL만 적용한다.
+    closed_at = range_closed_at(end_de)
+    return lambda written_at: ttl_seconds if written_at >= closed_at else OPEN_RANGE_CACHE_TTL
 
 
 def iter_list(
@@ -137,6 +191,7 @@ def iter_list(
     timeout: int = 60,
     verify_ssl: bool = False,
     pblntf_ty: str = "B",
+    refresh: bool = False,
 ):
     page_no = 1
     while True:
@@ -148,9 +203,15 @@ def iter_list(
             "page_no": str(page_no),
             "page_count": str(page_count),
         }
-        resp = requests.get(LIST_API_URL, params=params, timeout=timeout, verify=verify_ssl)
-        resp.raise_for_status()
-        data = resp.json()
+        data = get_json(
+            _SESSION,
+            LIST_API_URL,
+            params,
+            timeout,
+            ttl_seconds=_range_cache_ttl(end_de, LIST_CACHE_TTL),
+            refresh=refresh,
+            verify_ssl=verify_ssl,
+        )
 
         if str(data.get("status")) != "000":
             raise RuntimeError(f"[{data.get('status')}] {data.get('message')}")
@@ -164,85 +225,120 @@ def iter_list(
         page_no += 1
 
 
-def get_major_report_list(api_key: str, bgn_de: str, end_de: str, verify_ssl: bool = False) -> pd.DataFrame:
-    rows = list(iter_list(api_key, bgn_de, end_de, verify_ssl=verify_ssl, pblntf_ty="B"))
+def get_major_report_list(
+    api_key: str,
+    bgn_de: str,
+    end_de: str,
+    verify_ssl: bool = False,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    # 보고서명은 항목마다 한 번만 정규화하고, 대상 보고서만 정규화한 이름과 함께 남긴다.
+    normalized = (
+        (item, normalize_report_nm(item.get("report_nm", "")))
+        for item in iter_list(api_key, bgn_de, end_de, verify_ssl=verify_ssl, pblntf_ty="B", refresh=refresh)
+    )
+    rows = [
+        {**item, "report_nm_norm": report_nm_norm}
+        for item, report_nm_norm in normalized
+        if report_nm_norm in TARGET_REPORT_TITLES
+    ]
     if not rows:
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows)
-    df["report_nm_norm"] = df["report_nm"].apply(normalize_report_nm)
-
-    out = df[df["report_nm_norm"].isin(TARGET_REPORT_TITLES)].copy()
-    out["URL"] = out["rcept_no"].astype(str).apply(
-        lambda x: f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={x}"
-    )
-    return out.drop(columns=["report_nm_norm"]).reset_index(drop=True)
+    out = pd.DataFrame.from_records(rows, columns=[*LIST_COLUMNS, "report_nm_norm"])
+    out["URL"] = "https://dart.fss.or.kr/dsaf001/main.do?rcpNo=" + out["rcept_no"].astype(str)
+    return out
 
 
-def _fetch_decision_list_by_corp_codes(
+def _fetch_decision_list(
     api_key: str,
-    corp_codes: list[str],
+    corp_code: str,
     api_url: str,
     bgn_de: str,
     end_de: str,
-    sleep_sec: float = 0.05,
-    timeout: int = 30,
-) -> pd.DataFrame:
-    chunks: list[pd.DataFrame] = []
+    timeout: int,
+    refresh: bool = False,
+) -> list[dict]:
+    params = {
+        "crtfc_key": api_key,
+        "corp_code": corp_code,
+        "bgn_de": bgn_de,
+        "end_de": end_de,
+    }
+    try:
+        data = get_json(
+            _SESSION,
+            api_url,
+            params,
+            timeout,
+            ttl_seconds=_range_cache_ttl(end_de, DECISION_CACHE_TTL),
+            refresh=refresh,
+        )
+    except Exception:
+        return []
 
-    for corp_code in corp_codes:
-        params = {
-            "crtfc_key": api_key,
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        try:
-            resp = requests.get(api_url, params=params, timeout=timeout)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception:
-            continue
+    if str(data.get("status")) != "000":
+        return []
 
-        if str(data.get("status")) != "000":
-            time.sleep(sleep_sec)
-            continue
+    item_list = data.get("list") or []
+    for item in item_list:
+        item.setdefault("corp_code", corp_code)
+    return item_list
 
-        item_list = data.get("list") or []
-        if not item_list:
-            time.sleep(sleep_sec)
-            continue
 
-        df_api = pd.DataFrame(item_list)
-        if df_api.empty:
-            time.sleep(sleep_sec)
-            continue
+def _fetch_decision_lists(
+    api_key: str,
+    corp_codes_by_url: dict[str, list[str]],
+    bgn_de: str,
+    end_de: str,
+    max_workers: int = MAX_WORKERS,
+    timeout: int = 30,
+    refresh: bool = False,
+) -> dict[str, pd.DataFrame]:
+    # DART 공시정보 API는 corp_code가 필수라 회사별 호출이 불가피하므로, 여러 API 호출을 한 풀에서 함께 처리한다.
+    jobs = [(api_url, corp_code) for api_url, corp_codes in corp_codes_by_url.items() for corp_code in corp_codes]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda job: _fetch_decision_list(api_key, job[1], job[0], bgn_de, end_de, timeout, refresh),
+                jobs,
+            )
+        )
 
-        if "corp_code" not in df_api.columns:
-            df_api["corp_code"] = corp_code
+    rows: dict[str, list[dict]] = {api_url: [] for api_url in corp_codes_by_url}
+    for (api_url, _), item_list in zip(jobs, results):
+        rows[api_url].extend(item_list)
 
-        chunks.append(df_api)
-        time.sleep(sleep_sec)
+    return {api_url: pd.DataFrame.from_records(items) for api_url, items in rows.items()}
 
-    if not chunks:
-        return pd.DataFrame()
 
-    return pd.concat(chunks, axis=0, ignore_index=True)
+def _fetch_decision_list_by_corp_codes(
+    api_key: str,
+    corp_codes: list[str],
+    api_url: str,
+    bgn_de: str,
+    end_de: str,
+    max_workers: int = MAX_WORKERS,
+    timeout: int = 30,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    return _fetch_decision_lists(
+        api_key=api_key,
+        corp_codes_by_url={api_url: corp_codes},
+        bgn_de=bgn_de,
+        end_de=end_de,
+        max_workers=max_workers,
+        timeout=timeout,
+        refresh=refresh,
+    )[api_url]
 
 
 def _filter_by_rcept_window(df: pd.DataFrame, bgn_de: str, end_de: str) -> pd.DataFrame:
     if df.empty or "rcept_no" not in df.columns:
         return df.copy()
 
-    out = df.copy()
-    out["rcept_ymd"] = out["rcept_no"].astype(str).str[:8]
-    out = out[
-        out["rcept_ymd"].str.fullmatch(r"\d{8}", na=False)
-        & (out["rcept_ymd"] >= bgn_de)
-        & (out["rcept_ymd"] <= end_de)
-    ].copy()
-    out.drop(columns=["rcept_ymd"], inplace=True)
-    return out
+    ymd = pd.to_numeric(df["rcept_no"].astype("string").str.slice(0, 8), errors="coerce")
+    return df[ymd.between(int(bgn_de), int(end_de))].copy()
 
 
 def _merge_target_metadata(source_df: pd.DataFrame, target_df: pd.DataFrame) -> pd.DataFrame:
@@ -294,38 +390,43 @@ def _select_and_rename_columns(df: pd.DataFrame, mapping: dict[str, str]) -> pd.
     return selected
 
 
+def _fetch_company_overview(
+    api_key: str,
+    corp_code: str,
+    timeout: int,
+    refresh: bool = False,
+) -> dict[str, str] | None:
+    params = {
+        "crtfc_key": api_key,
+        "corp_code": corp_code,
+    }
+    try:
+        data = get_json(_SESSION, COMPANY_API_URL, params, timeout, ttl_seconds=COMPANY_CACHE_TTL, refresh=refresh)
+    except Exception:
+        return None
+
+    if str(data.get("status")) != "000":
+        return None
+
+    return {
+        "corp_code": corp_code,
+        "bizr_no": data.get("bizr_no", ""),
+    }
+
+
 def fetch_company_overview_df(
     api_key: str,
     corp_codes: list[str],
-    sleep_sec: float = 0.05,
+    max_workers: int = MAX_WORKERS,
     timeout: int = 30,
+    refresh: bool = False,
 ) -> pd.DataFrame:
-    rows: list[dict[str, str]] = []
-
-    for corp_code in corp_codes:
-        params = {
-            "crtfc_key": api_key,
-            "corp_code": corp_code,
-        }
-        try:
-            resp = requests.get(COMPANY_API_URL, params=params, timeout=timeout)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception:
-            time.sleep(sleep_sec)
-            continue
-
-        if str(data.get("status")) != "000":
-            time.sleep(sleep_sec)
-            continue
-
-        rows.append(
-            {
-                "corp_code": corp_code,
-                "bizr_no": data.get("bizr_no", ""),
-            }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda corp_code: _fetch_company_overview(api_key, corp_code, timeout, refresh),
+            corp_codes,
         )
-        time.sleep(sleep_sec)
+        rows = [row for row in results if row is not None]
 
     if not rows:
         return pd.DataFrame(columns=["corp_code", "bizr_no"])
@@ -349,13 +450,14 @@ def fetch_paid_increase_decision_df(
     major_list_df: pd.DataFrame,
     bgn_de: str,
     end_de: str,
-    sleep_sec: float = 0.05,
+    max_workers: int = MAX_WORKERS,
     timeout: int = 30,
+    refresh: bool = False,
 ) -> pd.DataFrame:
     bgn_for_api = (datetime.strptime(bgn_de, "%Y%m%d") - relativedelta(months=8)).strftime("%Y%m%d")
 
     target = major_list_df[
-        major_list_df["report_nm"].apply(normalize_report_nm).isin(PAID_INCREASE_REPORT_TITLES)
+        major_list_df["report_nm_norm"].isin(PAID_INCREASE_REPORT_TITLES)
     ].copy()
     if target.empty:
         return pd.DataFrame()
@@ -367,8 +469,9 @@ def fetch_paid_increase_decision_df(
         api_url=PIIC_API_URL,
         bgn_de=bgn_for_api,
         end_de=end_de,
-        sleep_sec=sleep_sec,
+        max_workers=max_workers,
         timeout=timeout,
+        refresh=refresh,
     )
     if out.empty:
         return out
@@ -385,39 +488,33 @@ def fetch_cb_bw_unified_df(
     major_list_df: pd.DataFrame,
     bgn_de: str,
     end_de: str,
-    sleep_sec: float = 0.05,
+    max_workers: int = MAX_WORKERS,
     timeout: int = 30,
+    refresh: bool = False,
 ) -> pd.DataFrame:
     bgn_for_api = (datetime.strptime(bgn_de, "%Y%m%d") - relativedelta(months=8)).strftime("%Y%m%d")
 
     cb_target = major_list_df[
-        major_list_df["report_nm"].apply(normalize_report_nm).isin(CB_REPORT_TITLES)
+        major_list_df["report_nm_norm"].isin(CB_REPORT_TITLES)
     ].copy()
     bw_target = major_list_df[
-        major_list_df["report_nm"].apply(normalize_report_nm).isin(BW_REPORT_TITLES)
+        major_list_df["report_nm_norm"].isin(BW_REPORT_TITLES)
     ].copy()
 
     cb_codes = cb_target["corp_code"].dropna().astype(str).unique().tolist()
     bw_codes = bw_target["corp_code"].dropna().astype(str).unique().tolist()
 
-    cb_df = _fetch_decision_list_by_corp_codes(
-        api_key=api_key,
-        corp_codes=cb_codes,
-        api_url=CB_API_URL,
-        bgn_de=bgn_for_api,
-        end_de=end_de,
-        sleep_sec=sleep_sec,
-        timeout=timeout,
-    )
-    bw_df = _fetch_decision_list_by_corp_codes(
+    decision_dfs = _fetch_decision_lists(
         api_key=api_key,
-        corp_codes=bw_codes,
-        api_url=BW_API_URL,
+        corp_codes_by_url={CB_API_URL: cb_codes, BW_API_URL: bw_codes},
         bgn_de=bgn_for_api,
         end_de=end_de,
-        sleep_sec=sleep_sec,
+        max_workers=max_workers,
         timeout=timeout,
+        refresh=refresh,
     )
+    cb_df = decision_dfs[CB_API_URL]
+    bw_df = decision_dfs[BW_API_URL]
 
     cb_df = _filter_by_rcept_window(_merge_target_metadata(cb_df, cb_target), bgn_de, end_de)
     bw_df = _filter_by_rcept_window(_merge_target_metadata(bw_df, bw_target), bgn_de, end_de)
@@ -425,8 +522,9 @@ def fetch_cb_bw_unified_df(
     overview_df = fetch_company_overview_df(
         api_key=api_key,
         corp_codes=sorted(set(cb_codes + bw_codes)),
-        sleep_sec=sleep_sec,
+        max_workers=max_workers,
         timeout=timeout,
+        refresh=refresh,
     )
     if not overview_df.empty:
         if not cb_df.empty and "corp_code" in cb_df.columns:
@@ -485,73 +583,104 @@ def fetch_cb_bw_unified_df(
     out["작성책임자_직책"] = ""
     out["작성책임자_성명"] = ""
     out["작성책임자_전화번호"] = ""
-    out["URL"] = out["접수번호"].astype(str).apply(
-        lambda x: f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={x}"
-    )
+    out["URL"] = "https://dart.fss.or.kr/dsaf001/main.do?rcpNo=" + out["접수번호"].astype(str)
 
     out = out.drop_duplicates(subset=["접수번호", "고유번호"]).reset_index(drop=True)
     return out
 
 
+def _numeric_row_sum(df: pd.DataFrame, cols: list[str]) -> np.ndarray:
+    if not cols:
+        return np.zeros(len(df))
+
+    numbers = np.column_stack([_coerce_numeric(df[col]).to_numpy(dtype=float, na_value=np.nan) for col in cols])
+    return np.nan_to_num(numbers).sum(axis=1)
+
+
 def add_finance_columns(piic_df: pd.DataFrame) -> pd.DataFrame:
     if piic_df.empty:
         return piic_df.copy()
 
     df = piic_df.copy()
 
-    fdpp_cols = [c for c in df.columns if "fdpp" in c.lower()]
-    df["fdpp_sum"] = df[fdpp_cols].apply(to_numeric_series).sum(axis=1) if fdpp_cols else 0
-
-    nstk_cols = [c for c in ["nstk_ostk_cnt", "nstk_estk_cnt"] if c in df.columns]
-    df["nstk_sum"] = df[nstk_cols].apply(to_numeric_series).sum(axis=1) if nstk_cols else 0
+    fdpp_sum = _numeric_row_sum(df, [c for c in df.columns if "fdpp" in c.lower()])
+    nstk_sum = _numeric_row_sum(df, [c for c in ["nstk_ostk_cnt", "nstk_estk_cnt"] if c in df.columns])
 
+    df["fdpp_sum"] = fdpp_sum
+    df["nstk_sum"] = nstk_sum
     df["nstk_ps"] = (
-        (df["fdpp_sum"] / df["nstk_sum"])
-        .replace([np.inf, -np.inf], np.nan)
-        .fillna(0)
+        np.divide(fdpp_sum, nstk_sum, out=np.zeros_like(fdpp_sum), where=nstk_sum != 0)
         .round()
-        .astype(int)
+        .astype(np.int64)
     )
     return df
 
 
-def fetch_report_fulltext_df(api_key: str, df_with_rcept_no: pd.DataFrame, timeout: int = 60) -> pd.DataFrame:
-    rows = []
-    rcept_nos = df_with_rcept_no["rcept_no"].dropna().astype(str).unique().tolist()
+def _parse_report_zip(rcept_no: str, content: bytes) -> dict:
+    zf = zipfile.ZipFile(io.BytesIO(content))
+    xml_names = [n for n in zf.namelist() if n.lower().endswith(".xml")]
+    if not xml_names:
+        return {"rcept_no": rcept_no, "error": "xml file not found"}
 
-    for rcept_no in rcept_nos:
-        try:
-            res = requests.get(
-                DOC_API_URL,
-                params={"crtfc_key": api_key, "rcept_no": rcept_no},
-                timeout=timeout,
-            )
-            res.raise_for_status()
+    with zf.open(xml_names[0]) as xml_file:
+        return {"rcept_no": rcept_no, **parse_report_fields(xml_file)}
 
-            zf = zipfile.ZipFile(io.BytesIO(res.content))
-            xml_names = [n for n in zf.namelist() if n.lower().endswith(".xml")]
-            if not xml_names:
-                rows.append({"rcept_no": rcept_no, "fulltext_xml": None, "error": "xml file not found"})
-                continue
 
-            xml_text = zf.read(xml_names[0]).decode("utf-8", errors="ignore")
-            rows.append({"rcept_no": rcept_no, "fulltext_xml": xml_text})
-        except Exception as exc:
-            rows.append({"rcept_no": rcept_no, "fulltext_xml": None, "error": str(exc)})
+def _fetch_report_fulltext(api_key: str, rcept_no: str, timeout: int, refresh: bool = False) -> dict:
+    # 다운로드 직후 같은 워커 스레드에서 파싱까지 처리해, 문서별 파싱이 다른 문서의 다운로드와 겹쳐 진행되게 한다.
+    try:
+        content = cached_get(
+            _SESSION,
+            DOC_API_URL,
+            {"crtfc_key": api_key, "rcept_no": rcept_no},
+            timeout,
+            DOC_CACHE_TTL,
+            refresh=refresh,
+            cacheable=lambda data: zipfile.is_zipfile(io.BytesIO(data)),
+        )
+        return _parse_report_zip(rcept_no, content)
+    except Exception as exc:
+        return {"rcept_no": rcept_no, "error": str(exc)}
 
-    return pd.DataFrame(rows)
 
+def fetch_report_fulltext_df(
+    api_key: str,
+    rcept_nos: Iterable[str],
+    max_workers: int = MAX_WORKERS,
+    timeout: int = 60,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    # 같은 접수번호는 한 번만 받아서 파싱하고, 결과는 호출부에서 rcept_no 기준으로 붙인다.
+    rcept_nos = list(dict.fromkeys(str(rcept_no) for rcept_no in rcept_nos))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        rows = list(
+            executor.map(lambda rcept_no: _fetch_report_fulltext(api_key, rcept_no, timeout, refresh), rcept_nos)
+        )
+
+    return pd.DataFrame(rows, columns=["rcept_no", *REPORT_FIELD_COLUMNS, "error"])
+
+
+_CELL_TAGS = {"td", "tu", "te"}
 
-def parse_contact_fields(xml_text: str) -> dict:
-    raw_cells = re.findall(r"<TD[^>]*>(.*?)</TD>", xml_text, flags=re.IGNORECASE | re.DOTALL)
 
-    def clean(s: str) -> str:
-        s = re.sub(r"<[^>]+>", "", s)
-        s = html.unescape(s).replace("\xa0", " ")
-        return re.sub(r"\s+", " ", s).strip()
+def _scan_document(source) -> tuple[list[tuple[str, str]], dict[str, str]]:
+    # DART 문서는 &nbsp; 같은 HTML 엔티티와 이스케이프되지 않은 <, &가 섞여 있어 HTML 모드로 읽는다.
+    # HTML 파서는 태그/속성 이름을 소문자로 바꾼다. 파싱 오류는 호출부의 error 컬럼으로 남긴다.
+    cells: list[tuple[str, str]] = []
+    aunit_values: dict[str, str] = {}
+    for _, el in etree.iterparse(source, events=("end",), html=True, huge_tree=True, encoding="utf-8"):
+        aunit = el.get("aunit")
+        if aunit and aunit not in aunit_values and el.get("aunitvalue"):
+            aunit_values[aunit] = el.get("aunitvalue")
+        if el.tag in _CELL_TAGS:
+            cells.append((el.tag, _RE_WS.sub(" ", "".join(el.itertext())).strip()))
+            el.clear()
+    return cells, aunit_values
 
-    cells = [clean(x) for x in raw_cells]
-    norm = [re.sub(r"[\s:()]", "", c) for c in cells]
+
+def parse_contact_fields(cells: list[str]) -> dict:
+    norm = [_RE_LABEL_NOISE.sub("", c) for c in cells]
 
     def next_non_empty(idx: int):
         for j in range(idx + 1, len(cells)):
@@ -559,9 +688,6 @@ def parse_contact_fields(xml_text: str) -> dict:
                 return cells[j]
         return None
 
-    def strip_prefix(text: str, pattern: str):
-        return re.sub(pattern, "", text).strip()
-
     out = {
         "대표이사": None,
         "본점소재지": None,
@@ -580,46 +706,48 @@ def parse_contact_fields(xml_text: str) -> dict:
             writer_start = i
 
     if writer_start is not None:
-        for j in range(writer_start + 1, min(writer_start + 12, len(cells))):
-            t = cells[j]
-            n_val = norm[j]
-            if "직책" in n_val and out["작성책임자_직책"] is None:
-                out["작성책임자_직책"] = strip_prefix(t, r"^\(?\s*직\s*책\s*\)?\s*")
-            elif "성명" in n_val and out["작성책임자_성명"] is None:
-                out["작성책임자_성명"] = strip_prefix(t, r"^\(?\s*성\s*명\s*\)?\s*")
-            elif "전화" in n_val and out["작성책임자_전화번호"] is None:
-                out["작성책임자_전화번호"] = strip_prefix(t, r"^\(?\s*전\s*화\s*\)?\s*")
+        # 작성책임자 다음 셀들을 한 줄씩 이어 붙여 직책/성명/전화를 한 번에 찾는다.
+        block = "\n".join(cells[writer_start + 1 : writer_start + 12])
+        writer_keys = {"직책": "작성책임자_직책", "성명": "작성책임자_성명", "전화": "작성책임자_전화번호"}
+        for m in _RE_WRITER.finditer(block):
+            key = writer_keys[_RE_WS.sub("", m.group(1))[:2]]
+            if out[key] is None:
+                out[key] = m.group(2).strip()
 
     return out
 
 
-def parse_schedule_fields(xml_text: str) -> dict:
+def parse_schedule_fields(cells: list[tuple[str, str]], aunit_values: dict[str, str]) -> dict:
     out = {"납입일": None, "신주상장예정일": None}
-    if not isinstance(xml_text, str) or not xml_text:
-        return out
 
-    m_pym = re.search(r'AUNIT\s*=\s*"PYM_DT"[^>]*AUNITVALUE\s*=\s*"([^"]+)"', xml_text, flags=re.IGNORECASE)
-    m_lst = re.search(r'AUNIT\s*=\s*"LST_PLN_DT"[^>]*AUNITVALUE\s*=\s*"([^"]+)"', xml_text, flags=re.IGNORECASE)
+    if aunit_values:
+        for key, aunit in {"납입일": "PYM_DT", "신주상장예정일": "LST_PLN_DT"}.items():
+            v = aunit_values.get(aunit, "").strip()
+            out[key] = None if v in {"", "-"} else v
 
-    if m_pym:
-        v = m_pym.group(1).strip()
-        out["납입일"] = None if v in {"", "-"} else v
-    if m_lst:
-        v = m_lst.group(1).strip()
-        out["신주상장예정일"] = None if v in {"", "-"} else v
+    pending = {
+        key: pattern
+        for key, pattern in {"납입일": _RE_PYM_LABEL, "신주상장예정일": _RE_LST_LABEL}.items()
+        if out[key] is None
+    }
+    prev_tag, prev_text = None, ""
+    for tag, text in cells:
+        if not pending:
+            break
+        if prev_tag == "td" and tag in {"tu", "te"}:
+            for key, pattern in list(pending.items()):
+                if pattern.search(prev_text):
+                    out[key] = None if text in {"", "-"} else text
+                    del pending[key]
+        prev_tag, prev_text = tag, text
 
-    if out["납입일"] is None:
-        m = re.search(r'납입일</TD>\s*<T[UE][^>]*>(.*?)</T[UE]>', xml_text, flags=re.IGNORECASE | re.DOTALL)
-        if m:
-            txt = re.sub(r"<[^>]+>", "", m.group(1)).strip()
-            out["납입일"] = None if txt in {"", "-"} else txt
+    return out
 
-    if out["신주상장예정일"] is None:
-        m = re.search(r'신주의\s*상장\s*예정일</TD>\s*<T[UE][^>]*>(.*?)</T[UE]>', xml_text, flags=re.IGNORECASE | re.DOTALL)
-        if m:
-            txt = re.sub(r"<[^>]+>", "", m.group(1)).strip()
-            out["신주상장예정일"] = None if txt in {"", "-"} else txt
 
+def parse_report_fields(source) -> dict:
+    cells, aunit_values = _scan_document(source)
+    out = parse_contact_fields([text for tag, text in cells if tag == "td"])
+    out.update(parse_schedule_fields(cells, aunit_values))
     return out
 
 
@@ -634,26 +762,8 @@ def build_output_df(piic_df: pd.DataFrame, fulltext_df: pd.DataFrame) -> pd.Data
     if name_col != "corp_name":
         out = out.rename(columns={name_col: "corp_name"})
 
-    parsed_rows = []
-    for _, row in fulltext_df.iterrows():
-        xml_text = row.get("fulltext_xml")
-        base = {
-            "대표이사": None,
-            "본점소재지": None,
-            "작성책임자_직책": None,
-            "작성책임자_성명": None,
-            "작성책임자_전화번호": None,
-            "납입일": None,
-            "신주상장예정일": None,
-        }
-        if isinstance(xml_text, str) and xml_text:
-            base.update(parse_contact_fields(xml_text))
-            base.update(parse_schedule_fields(xml_text))
-        base["rcept_no"] = row.get("rcept_no")
-        parsed_rows.append(base)
-
-    parse_df = pd.DataFrame(parsed_rows).drop_duplicates(subset=["rcept_no"])
-    return out.merge(parse_df, on="rcept_no", how="left")
+    parsed_df = fulltext_df.loc[:, ["rcept_no", *REPORT_FIELD_COLUMNS]].drop_duplicates(subset=["rcept_no"])
+    return out.merge(parsed_df, on="rcept_no", how="left")
 
 
 def fill_contact_fields_from_fulltext(target_df: pd.DataFrame, fulltext_df: pd.DataFrame) -> pd.DataFrame:
@@ -662,22 +772,11 @@ def fill_contact_fields_from_fulltext(target_df: pd.DataFrame, fulltext_df: pd.D
 
     base_cols = ["대표이사", "주소", "작성책임자_직책", "작성책임자_성명", "작성책임자_전화번호"]
 
-    parsed_rows = []
-    for _, row in fulltext_df.iterrows():
-        xml_text = row.get("fulltext_xml")
-        parsed = parse_contact_fields(xml_text) if isinstance(xml_text, str) and xml_text else {}
-        parsed_rows.append(
-            {
-                "rcept_no": row.get("rcept_no"),
-                "대표이사": parsed.get("대표이사"),
-                "주소": parsed.get("본점소재지"),
-                "작성책임자_직책": parsed.get("작성책임자_직책"),
-                "작성책임자_성명": parsed.get("작성책임자_성명"),
-                "작성책임자_전화번호": parsed.get("작성책임자_전화번호"),
-            }
-        )
-
-    parsed_df = pd.DataFrame(parsed_rows).drop_duplicates(subset=["rcept_no"])
+    parsed_df = (
+        fulltext_df.loc[:, ["rcept_no", "대표이사", "본점소재지", "작성책임자_직책", "작성책임자_성명", "작성책임자_전화번호"]]
+        .rename(columns={"본점소재지": "주소"})
+        .drop_duplicates(subset=["rcept_no"])
+    )
     out = target_df.copy()
 
     if "rcept_no" not in out.columns:
@@ -732,13 +831,12 @@ def _prepare_major_paid_increase_sheet(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
     for col in ["대표이사", "작성책임자_직책", "작성책임자_성명"]:
         if col in out.columns:
-            out[col] = out[col].astype(str).str.replace(r"\s+", "", regex=True)
+            out[col] = out[col].astype(str).str.replace(_RE_WS, "", regex=True)
             out.loc[out[col].isin(["None", "nan"]), col] = ""
 
     for col in ["발행주식수", "발행가액", "발행금액"]:
         if col in out.columns:
-            out[col] = out[col].astype(str).str.replace(",", "", regex=False).replace("-", pd.NA)
-            out[col] = pd.to_numeric(out[col], errors="coerce")
+            out[col] = _coerce_numeric(out[col])
 
     return out
 
@@ -747,7 +845,7 @@ def _prepare_cb_bw_sheet(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
     for col in ["대표이사", "작성책임자_직책", "작성책임자_성명"]:
         if col in out.columns:
-            out[col] = out[col].astype(str).str.replace(r"\s+", "", regex=True)
+            out[col] = out[col].astype(str).str.replace(_RE_WS, "", regex=True)
             out.loc[out[col].isin(["None", "nan"]), col] = ""
 
     for col in ["사채총액", "전환가액"]:
@@ -761,29 +859,26 @@ def _prepare_cb_bw_sheet(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
-def _write_sheet(writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str, num_cols: list[str]):
-    df.to_excel(writer, index=False, sheet_name=sheet_name)
-    ws = writer.sheets[sheet_name]
-    wb = writer.book
-    comma_fmt = wb.add_format({"num_format": "#,##0"})
-
-    for col in num_cols:
-        if col in df.columns:
-            idx = df.columns.get_loc(col)
-            ws.set_column(idx, idx, 14, comma_fmt)
-
-    if "URL" in df.columns:
-        idx = df.columns.get_loc("URL")
-        ws.set_column(idx, idx, 53)
+def _major_col_formats(num_cols: list[str]) -> dict[str, tuple[float, dict | None]]:
+    return {**{col: (14, {"num_format": "#,##0"}) for col in num_cols}, "URL": (53, None)}
 
 
 def _write_major_excel(file_obj, paid_increase_df: pd.DataFrame, cb_bw_df: pd.DataFrame):
     df_paid = _prepare_major_paid_increase_sheet(paid_increase_df)
     df_cb_bw = _prepare_cb_bw_sheet(cb_bw_df)
 
-    with pd.ExcelWriter(file_obj, engine="xlsxwriter") as writer:
-        _write_sheet(writer, df_paid, "제3자배정_유상증자", ["발행주식수", "발행가액", "발행금액"])
-        _write_sheet(writer, df_cb_bw, "전환사채_신주인수권부사채", ["사채총액", "전환가액"])
+    with pd.ExcelWriter(
+        file_obj,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"constant_memory": True, "strings_to_urls": False}},
+    ) as writer:
+        write_sheet(writer, df_paid, "제3자배정_유상증자", _major_col_formats(["발행주식수", "발행가액", "발행금액"]))
+        write_sheet(writer, df_cb_bw, "전환사채_신주인수권부사채", _major_col_formats(["사채총액", "전환가액"]))
+
+
+def major_report_filename(bgn_de: str, end_de: str) -> str:
+    kst_now = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%y%m%d_%H%M")
+    return f"DART_주요사항보고서_주식연계채권등_F{bgn_de}_T{end_de}_추출시간_{kst_now}.xlsx"
 
 
 def run_major_paid_increase_report_bytes(
@@ -792,10 +887,11 @@ def run_major_paid_increase_report_bytes(
     end_de: str,
     list_timeout: int = 60,
     request_timeout: int = 30,
-    sleep_sec: float = 0.05,
+    max_workers: int = MAX_WORKERS,
     verify_ssl: bool = False,
+    refresh: bool = False,
 ) -> tuple[bytes, str] | None:
-    major_list_df = get_major_report_list(api_key, bgn_de, end_de, verify_ssl=verify_ssl)
+    major_list_df = get_major_report_list(api_key, bgn_de, end_de, verify_ssl=verify_ssl, refresh=refresh)
     if major_list_df.empty:
         return None
 
@@ -804,21 +900,30 @@ def run_major_paid_increase_report_bytes(
         major_list_df=major_list_df,
         bgn_de=bgn_de,
         end_de=end_de,
-        sleep_sec=sleep_sec,
+        max_workers=max_workers,
         timeout=request_timeout,
+        refresh=refresh,
     )
     output_df = pd.DataFrame(columns=OUT_COLUMNS)
     if not piic_df.empty:
+        piic_rcept_nos = piic_df["rcept_no"].dropna().astype(str).unique()
         piic_overview_df = fetch_company_overview_df(
             api_key=api_key,
             corp_codes=piic_df["corp_code"].dropna().astype(str).unique().tolist(),
-            sleep_sec=sleep_sec,
+            max_workers=max_workers,
             timeout=request_timeout,
+            refresh=refresh,
         )
         if not piic_overview_df.empty and "corp_code" in piic_df.columns:
             piic_df = piic_df.merge(piic_overview_df, on="corp_code", how="left")
         piic_df = add_finance_columns(piic_df)
-        fulltext_df = fetch_report_fulltext_df(api_key, piic_df, timeout=list_timeout)
+        fulltext_df = fetch_report_fulltext_df(
+            api_key,
+            piic_rcept_nos,
+            max_workers=max_workers,
+            timeout=list_timeout,
+            refresh=refresh,
+        )
         output_df = build_output_df(piic_df, fulltext_df)
         output_df = format_output_df(output_df)
 
@@ -827,28 +932,28 @@ def run_major_paid_increase_report_bytes(
         major_list_df=major_list_df,
         bgn_de=bgn_de,
         end_de=end_de,
-        sleep_sec=sleep_sec,
+        max_workers=max_workers,
         timeout=request_timeout,
+        refresh=refresh,
     )
     cb_bw_output_df = pd.DataFrame(columns=CB_BW_OUT_COLUMNS)
     if not cb_bw_df.empty:
+        cb_bw_df = cb_bw_df.rename(columns={"접수번호": "rcept_no"})
         fulltext_cb_bw = fetch_report_fulltext_df(
             api_key,
-            cb_bw_df.rename(columns={"접수번호": "rcept_no"}),
+            cb_bw_df["rcept_no"].dropna().astype(str).unique(),
+            max_workers=max_workers,
             timeout=list_timeout,
+            refresh=refresh,
         )
-        cb_bw_output_df = fill_contact_fields_from_fulltext(
-            cb_bw_df.rename(columns={"접수번호": "rcept_no"}),
-            fulltext_cb_bw,
-        )
+        cb_bw_output_df = fill_contact_fields_from_fulltext(cb_bw_df, fulltext_cb_bw)
         cb_bw_output_df = cb_bw_output_df.rename(columns={"rcept_no": "접수번호"})
         cb_bw_output_df = format_cb_bw_output_df(cb_bw_output_df)
 
     if output_df.empty and cb_bw_output_df.empty:
         return None
 
-    kst_now = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%y%m%d_%H%M")
-    filename = f"DART_주요사항보고서_주식연계채권등_F{bgn_de}_T{end_de}_추출시간_{kst_now}.xlsx"
+    filename = major_report_filename(bgn_de, end_de)
 
     buffer = BytesIO()
     _write_major_excel(buffer, output_df, cb_bw_output_df)
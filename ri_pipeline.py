@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
 from zoneinfo import ZoneInfo
-import time
+import re
 import warnings
 
 import pandas as pd
-import requests
 from dateutil.relativedelta import relativedelta
+from urllib3.util.retry import Retry
 from xlsxwriter.utility import xl_col_to_name
 
+from dart_common import MAX_WORKERS, get_json, new_session, write_sheet
+
 
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 
@@ -20,6 +23,14 @@ LIST_API_URL = "https://opendart.fss.or.kr/api/list.json"
 ESTK_API_URL = "https://opendart.fss.or.kr/api/estkRs.json"
 COMPANY_API_URL = "https://opendart.fss.or.kr/api/company.json"
 
+_SESSION = new_session(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+)
+
+COMPANY_CACHE_TTL = 24 * 60 * 60
+
 MAP_DICT = {
     "corp_cls": "상장구분",
     "corp_code": "고유번호",
@@ -41,6 +52,31 @@ MAP_DICT = {
 
 CORP_CLS_MAP = {"Y": "코스피", "K": "코스닥", "N": "코넥스", "E": "기타"}
 
+# 일반사항 응답 중 시트 작성에 쓰는 원본 컬럼만 남긴다.
+_BASE_COLS_KEEP = {
+    "_corp_key",
+    "rcept_no",
+    "corp_code",
+    "corp_name",
+    "corp_cls",
+    "sbd",
+    "pymd",
+    "stkcnt",
+    "slprc",
+    "slta",
+}
+
+_RE_CORRECTION = re.compile(r"\[.*정정.*\]|\[발행조건확정\]")
+_RE_FINAL_TERMS = re.compile(r"\[발행조건확정\]")
+_RE_NON_DIGIT = re.compile(r"\D")
+
+
+def _numeric_sort_key(series: pd.Series) -> pd.Series:
+    # 접수일/접수번호/일자 문자열은 숫자만 남겨 정수로 정렬한다. 그 외 컬럼은 그대로 둔다.
+    if series.name in {"rcept_dt", "rcept_no", "납입기일"}:
+        return pd.to_numeric(series.astype(str).str.replace(_RE_NON_DIGIT, "", regex=True), errors="coerce")
+    return series
+
 
 def normalize_corp_code(value) -> str:
     if pd.isna(value):
@@ -60,12 +96,6 @@ def format_bizr_no(value) -> str:
     return text
 
 
-def _get_json(url: str, params: dict[str, str], timeout: int, verify_ssl: bool) -> dict:
-    resp = requests.get(url, params=params, timeout=timeout, verify=verify_ssl)
-    resp.raise_for_status()
-    return resp.json()
-
-
 def iter_list(
     api_key: str,
     bgn_de: str,
@@ -84,7 +114,7 @@ def iter_list(
             "page_no": str(page_no),
             "page_count": str(page_count),
         }
-        data = _get_json(LIST_API_URL, params=params, timeout=timeout, verify_ssl=verify_ssl)
+        data = get_json(_SESSION, LIST_API_URL, params=params, timeout=timeout, verify_ssl=verify_ssl)
 
         if str(data.get("status")) != "000":
             raise RuntimeError(data.get("message", "DART error"))
@@ -134,9 +164,7 @@ def _build_report_df(
 
     report_df["corp_code"] = report_df["corp_code"].apply(normalize_corp_code)
     report_df["rcept_no"] = report_df["rcept_no"].astype(str)
-    report_df["URL"] = report_df["rcept_no"].apply(
-        lambda x: f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={x}"
-    )
+    report_df["URL"] = "https://dart.fss.or.kr/dsaf001/main.do?rcpNo=" + report_df["rcept_no"].astype(str)
     return report_df.reset_index(drop=True)
 
 
@@ -144,7 +172,7 @@ def _build_check_list(report_df: pd.DataFrame) -> pd.DataFrame:
     if report_df.empty:
         return pd.DataFrame(columns=["회사명", "보고서명", "접수일", "접수번호", "URL"])
 
-    correction_mask = report_df["report_nm"].str.contains(r"\[.*정정.*\]|\[발행조건확정\]", na=False)
+    correction_mask = report_df["report_nm"].str.contains(_RE_CORRECTION, na=False)
     check_list = report_df.loc[
         correction_mask,
         ["corp_code", "corp_name", "report_nm", "rcept_dt", "rcept_no", "URL"],
@@ -154,17 +182,14 @@ def _build_check_list(report_df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame(columns=["회사명", "보고서명", "접수일", "접수번호", "URL"])
 
     check_list["corp_code"] = check_list["corp_code"].apply(normalize_corp_code)
-    check_list["has_final_terms"] = check_list["report_nm"].str.contains(r"\[발행조건확정\]", na=False)
+    check_list["has_final_terms"] = check_list["report_nm"].str.contains(_RE_FINAL_TERMS, na=False)
     check_list = check_list.sort_values(
         by=["corp_code", "corp_name", "has_final_terms", "rcept_dt", "rcept_no"],
         ascending=[True, True, False, False, False],
         kind="mergesort",
+        key=_numeric_sort_key,
     )
-    check_list = (
-        check_list.groupby(["corp_code", "corp_name"], as_index=False, sort=False)
-        .head(1)
-        .reset_index(drop=True)
-    )
+    check_list = check_list.drop_duplicates(subset=["corp_code", "corp_name"], keep="first").reset_index(drop=True)
 
     check_list = check_list.rename(
         columns={
@@ -177,19 +202,18 @@ def _build_check_list(report_df: pd.DataFrame) -> pd.DataFrame:
     return check_list.loc[:, ["회사명", "보고서명", "접수일", "접수번호", "URL"]]
 
 
-def _pick_preferred_report_meta(meta_df: pd.DataFrame) -> pd.DataFrame:
-    if meta_df.empty:
-        return meta_df
-
-    out = meta_df.copy()
+def _pick_preferred_report_meta(report_df: pd.DataFrame) -> pd.DataFrame:
+    # 회사별 대표 공시 1건(발행조건확정 우선, 최신 접수 순)을 corp_code 인덱스로 돌려준다.
+    out = report_df.loc[:, ["corp_code", "rcept_no", "corp_name", "corp_cls", "report_nm", "rcept_dt", "URL"]].copy()
     out["rcept_no"] = out["rcept_no"].astype(str)
-    out["has_final_terms"] = out["report_nm"].str.contains(r"\[발행조건확정\]", na=False)
+    out["has_final_terms"] = out["report_nm"].str.contains(_RE_FINAL_TERMS, na=False)
     out = out.sort_values(
         by=["has_final_terms", "rcept_dt", "rcept_no"],
         ascending=[False, False, False],
         kind="mergesort",
+        key=_numeric_sort_key,
     )
-    return out.head(1).drop(columns=["has_final_terms"]).reset_index(drop=True)
+    return out.drop_duplicates(subset=["corp_code"], keep="first").drop(columns=["has_final_terms"]).set_index("corp_code")
 
 
 def get_company_overview_fields(
@@ -197,6 +221,7 @@ def get_company_overview_fields(
     corp_code: str,
     timeout: int = 30,
     verify_ssl: bool = False,
+    refresh: bool = False,
 ) -> dict[str, str]:
     normalized = normalize_corp_code(corp_code)
     params = {
@@ -205,7 +230,15 @@ def get_company_overview_fields(
     }
 
     try:
-        data = _get_json(COMPANY_API_URL, params=params, timeout=timeout, verify_ssl=verify_ssl)
+        data = get_json(
+            _SESSION,
+            COMPANY_API_URL,
+            params=params,
+            timeout=timeout,
+            verify_ssl=verify_ssl,
+            ttl_seconds=COMPANY_CACHE_TTL,
+            refresh=refresh,
+        )
     except Exception:
         data = {}
 
@@ -231,21 +264,23 @@ def _fetch_overview_df(
     api_key: str,
     corp_codes: list[str],
     timeout: int,
-    sleep_sec: float,
+    max_workers: int,
     verify_ssl: bool,
+    refresh: bool = False,
 ) -> pd.DataFrame:
-    rows: list[dict[str, str]] = []
-
-    for corp_code in corp_codes:
-        rows.append(
-            get_company_overview_fields(
-                api_key=api_key,
-                corp_code=corp_code,
-                timeout=timeout,
-                verify_ssl=verify_ssl,
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        rows = list(
+            executor.map(
+                lambda corp_code: get_company_overview_fields(
+                    api_key=api_key,
+                    corp_code=corp_code,
+                    timeout=timeout,
+                    verify_ssl=verify_ssl,
+                    refresh=refresh,
+                ),
+                corp_codes,
             )
         )
-        time.sleep(sleep_sec)
 
     if not rows:
         return pd.DataFrame(columns=["corp_code", "bizr_no", "ceo_nm", "adres", "phn_no"])
@@ -255,19 +290,10 @@ def _fetch_overview_df(
     return out.drop_duplicates(subset=["corp_code"]).reset_index(drop=True)
 
 
-def _first_non_empty(series: pd.Series):
-    for value in series:
-        if pd.isna(value):
-            continue
-        text = str(value).strip()
-        if text and text.lower() not in {"nan", "none"}:
-            return value
-    return ""
-
-
 def merge_estk_detail_columns(df_base: pd.DataFrame, dfs: dict[str, pd.DataFrame]) -> pd.DataFrame:
     out = df_base.copy()
-    key_candidates = ["rcept_no", "corp_code", "corp_name", "stock_code", "stock_name"]
+    # 이름 컬럼은 그룹마다 표기가 달라질 수 있어 접수번호/고유번호로만 붙인다.
+    key_candidates = ["rcept_no", "corp_code"]
     wanted_cols = ["stkcnt", "slprc", "slta"]
 
     if "corp_code" in out.columns:
@@ -293,11 +319,14 @@ def merge_estk_detail_columns(df_base: pd.DataFrame, dfs: dict[str, pd.DataFrame
         if not merge_keys:
             continue
 
-        grouped = (
-            part.loc[:, merge_keys + value_cols]
-            .groupby(merge_keys, as_index=False)
-            .agg({col: _first_non_empty for col in value_cols})
-        )
+        # 빈 값은 NaN으로 바꿔 두고 groupby.first()로 그룹별 첫 유효값을 고른다.
+        values = part.loc[:, merge_keys + value_cols]
+        for col in value_cols:
+            text = values[col].astype(str).str.strip()
+            valid = values[col].notna() & (text != "") & ~text.str.lower().isin(["nan", "none"])
+            values[col] = values[col].where(valid)
+        grouped = values.groupby(merge_keys, as_index=False).first()
+        grouped[value_cols] = grouped[value_cols].fillna("")
 
         out = out.merge(grouped, on=merge_keys, how="left", suffixes=("", "_detail"))
 
@@ -355,23 +384,44 @@ def _fetch_estk_groups(
     end_de: str,
     timeout: int,
     verify_ssl: bool,
-) -> dict[str, pd.DataFrame]:
+) -> dict[str, list[dict]]:
     params = {
         "crtfc_key": api_key,
         "corp_code": normalize_corp_code(corp_code),
         "bgn_de": bgn_de,
         "end_de": end_de,
     }
-    data = _get_json(ESTK_API_URL, params=params, timeout=timeout, verify_ssl=verify_ssl)
+    data = get_json(_SESSION, ESTK_API_URL, params=params, timeout=timeout, verify_ssl=verify_ssl)
 
     if str(data.get("status")) != "000":
         raise RuntimeError(f"{data.get('status')}: {data.get('message')}")
 
-    dfs: dict[str, pd.DataFrame] = {}
+    groups: dict[str, list[dict]] = {}
     for group in data.get("group", []):
-        title = group.get("title", "group")
-        dfs[title] = pd.DataFrame(group.get("list", []))
-    return dfs
+        groups.setdefault(group.get("title", "group"), []).extend(group.get("list") or [])
+    return groups
+
+
+def _try_fetch_estk_groups(
+    api_key: str,
+    corp_code: str,
+    bgn_de: str,
+    end_de: str,
+    timeout: int,
+    verify_ssl: bool,
+) -> dict[str, list[dict]] | Exception:
+    # 워커에서 예외를 그대로 돌려주고, 로그는 호출부에서 회사 순서대로 남긴다.
+    try:
+        return _fetch_estk_groups(
+            api_key=api_key,
+            corp_code=corp_code,
+            bgn_de=bgn_de,
+            end_de=end_de,
+            timeout=timeout,
+            verify_ssl=verify_ssl,
+        )
+    except Exception as exc:
+        return exc
 
 
 def _build_general_sheet_df(
@@ -380,91 +430,104 @@ def _build_general_sheet_df(
     bgn_de: str,
     end_de: str,
     request_timeout: int,
-    sleep_sec: float,
+    max_workers: int,
     verify_ssl: bool,
+    refresh: bool = False,
 ) -> pd.DataFrame:
     if report_df.empty:
         return pd.DataFrame()
 
     corp_codes = report_df["corp_code"].dropna().astype(str).unique().tolist()
-    overview_df = _fetch_overview_df(
-        api_key=api_key,
-        corp_codes=corp_codes,
-        timeout=request_timeout,
-        sleep_sec=sleep_sec,
-        verify_ssl=verify_ssl,
-    )
 
-    base_list: list[pd.DataFrame] = []
     api_bgn_de = (datetime.strptime(bgn_de, "%Y%m%d") - relativedelta(months=6)).strftime("%Y%m%d")
     api_end_de = end_de
 
-    for corp_code in corp_codes:
-        target_meta = report_df.loc[
-            report_df["corp_code"] == normalize_corp_code(corp_code),
-            ["rcept_no", "corp_name", "corp_cls", "report_nm", "rcept_dt", "URL"],
-        ].drop_duplicates()
-        preferred_meta = _pick_preferred_report_meta(target_meta)
-
-        try:
-            dfs = _fetch_estk_groups(
-                api_key=api_key,
-                corp_code=corp_code,
-                bgn_de=api_bgn_de,
-                end_de=api_end_de,
-                timeout=request_timeout,
-                verify_ssl=verify_ssl,
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        estk_results = list(
+            executor.map(
+                lambda corp_code: _try_fetch_estk_groups(
+                    api_key=api_key,
+                    corp_code=corp_code,
+                    bgn_de=api_bgn_de,
+                    end_de=api_end_de,
+                    timeout=request_timeout,
+                    verify_ssl=verify_ssl,
+                ),
+                corp_codes,
             )
-        except Exception as exc:
-            print(f"[SKIP] estkRs 실패: {corp_code} / {exc}")
-            time.sleep(sleep_sec)
+        )
+
+    # 회사별로는 응답 행(dict)만 모으고, DataFrame 생성/병합/이름변경/중복제거는 루프 밖에서 한 번만 한다.
+    base_rows: list[dict] = []
+    base_corp_codes: list[str] = []
+    group_rows: dict[str, list[dict]] = {}
+    preferred_meta = _pick_preferred_report_meta(report_df)
+
+    for corp_code, groups in zip(corp_codes, estk_results):
+        if isinstance(groups, Exception):
+            print(f"[SKIP] estkRs 실패: {corp_code} / {groups}")
             continue
 
-        df_base = dfs.get("일반사항")
-        if df_base is None or df_base.empty:
+        corp_base_rows = groups.get("일반사항") or []
+        if not corp_base_rows:
             print(f"[SKIP] 일반사항 없음: {corp_code}")
-            time.sleep(sleep_sec)
             continue
 
-        df_base = df_base.copy()
-        if "corp_code" not in df_base.columns:
-            df_base["corp_code"] = normalize_corp_code(corp_code)
-
-        df_base = merge_estk_detail_columns(df_base, dfs)
-        df_base = merge_company_overview(df_base, overview_df)
-
-        if "rcept_no" in df_base.columns:
-            df_base["rcept_no"] = df_base["rcept_no"].astype(str)
-            if not preferred_meta.empty:
-                preferred_rcept_no = preferred_meta.loc[0, "rcept_no"]
-                if preferred_rcept_no in df_base["rcept_no"].values:
-                    df_base = df_base.loc[df_base["rcept_no"] == preferred_rcept_no].copy()
-                else:
-                    print(f"[INFO] preferred rcept_no fallback: {corp_code} / {preferred_rcept_no}")
-
-        if not preferred_meta.empty:
-            preferred_row = preferred_meta.iloc[0]
-            df_base["corp_name"] = preferred_row["corp_name"]
-            df_base["corp_cls"] = preferred_row["corp_cls"]
-            df_base["URL"] = preferred_row["URL"]
-        elif "URL" not in df_base.columns:
-            df_base["URL"] = df_base["rcept_no"].astype(str).apply(
-                lambda x: f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={x}"
-            )
-
-        df_base = df_base.rename(columns=MAP_DICT)
-        if "사업자등록번호" not in df_base.columns:
-            df_base["사업자등록번호"] = ""
-        else:
-            df_base["사업자등록번호"] = df_base["사업자등록번호"].apply(format_bizr_no)
+        normalized = normalize_corp_code(corp_code)
+        for title, rows in groups.items():
+            for row in rows:
+                row.setdefault("corp_code", normalized)
+            group_rows.setdefault(title, []).extend(rows)
+
+        if any("rcept_no" in row for row in corp_base_rows) and corp_code in preferred_meta.index:
+            preferred_rcept_no = preferred_meta.at[corp_code, "rcept_no"]
+            matched_rows = [row for row in corp_base_rows if str(row.get("rcept_no")) == preferred_rcept_no]
+            if matched_rows:
+                corp_base_rows = matched_rows
+            else:
+                print(f"[INFO] preferred rcept_no fallback: {corp_code} / {preferred_rcept_no}")
 
-        base_list.append(df_base)
-        time.sleep(sleep_sec)
+        base_rows.extend({**row, "_corp_key": corp_code} for row in corp_base_rows)
+        base_corp_codes.append(corp_code)
 
-    if not base_list:
+    if not base_rows:
         return pd.DataFrame()
 
-    df_base = pd.concat(base_list, ignore_index=True).drop_duplicates().reset_index(drop=True)
+    df_base = pd.DataFrame(base_rows)
+    df_base = df_base.loc[:, [c for c in df_base.columns if c in _BASE_COLS_KEEP]]
+    df_base = merge_estk_detail_columns(
+        df_base,
+        {title: pd.DataFrame(rows) for title, rows in group_rows.items()},
+    )
+    # 기업개황은 일반사항 행이 남은 회사만 조회한다.
+    overview_df = _fetch_overview_df(
+        api_key=api_key,
+        corp_codes=base_corp_codes,
+        timeout=request_timeout,
+        max_workers=max_workers,
+        verify_ssl=verify_ssl,
+        refresh=refresh,
+    )
+    df_base = merge_company_overview(df_base, overview_df)
+
+    # 상세/기업개황 병합이 끝난 뒤에 목록 기준 회사명/상장구분/URL로 덮어쓴다.
+    has_preferred = df_base["_corp_key"].isin(preferred_meta.index)
+    for col in ["corp_name", "corp_cls", "URL"]:
+        df_base[col] = df_base["_corp_key"].map(preferred_meta[col]).where(has_preferred, df_base.get(col))
+    if "rcept_no" in df_base.columns:
+        df_base["URL"] = df_base["URL"].fillna("https://dart.fss.or.kr/dsaf001/main.do?rcpNo=" + df_base["rcept_no"].astype(str))
+
+    dedup_keys = [c for c in ["rcept_no", "corp_code"] if c in df_base.columns]
+    df_base = (
+        df_base.drop(columns=["_corp_key"])
+        .drop_duplicates(subset=dedup_keys or None)
+        .rename(columns=MAP_DICT)
+        .reset_index(drop=True)
+    )
+    if "사업자등록번호" not in df_base.columns:
+        df_base["사업자등록번호"] = ""
+    else:
+        df_base["사업자등록번호"] = df_base["사업자등록번호"].apply(format_bizr_no)
 
     sort_cols = [
         "회사명",
@@ -495,7 +558,7 @@ def _build_general_sheet_df(
         df_base["상장구분"] = df_base["상장구분"].map(CORP_CLS_MAP).fillna(df_base["상장구분"])
 
     if "납입기일" in df_base.columns:
-        df_base = df_base.sort_values(by="납입기일", ascending=False, kind="mergesort")
+        df_base = df_base.sort_values(by="납입기일", ascending=False, kind="mergesort", key=_numeric_sort_key)
     else:
         df_base = df_base.sort_values(by="회사명", ascending=True, kind="mergesort")
 
@@ -503,42 +566,37 @@ def _build_general_sheet_df(
 
 
 def _write_excel(file_obj, check_list: pd.DataFrame, df_base: pd.DataFrame):
-    with pd.ExcelWriter(file_obj, engine="xlsxwriter") as writer:
-        check_list.to_excel(writer, index=False, sheet_name="검토목록")
-        df_base.to_excel(writer, index=False, sheet_name="일반사항")
+    # 검토목록 회사 여부는 미리 계산해 숨김 열에 기록하고, 조건부서식은 그 열만 참조한다.
+    highlight = not check_list.empty and "회사명" in check_list.columns and "회사명" in df_base.columns
+    if highlight:
+        df_base = df_base.assign(_hl=df_base["회사명"].isin(set(check_list["회사명"].dropna())))
+
+    with pd.ExcelWriter(
+        file_obj,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"constant_memory": True, "strings_to_urls": False}},
+    ) as writer:
+        ws_check = write_sheet(writer, check_list, "검토목록", {})
+        ws_base = write_sheet(writer, df_base, "일반사항", {"사업자등록번호": (16, None), "URL": (53, None)})
 
         workbook = writer.book
         highlight_fmt = workbook.add_format({"bg_color": "#F8D7DA"})
 
-        ws_base = writer.sheets["일반사항"]
-        ws_check = writer.sheets["검토목록"]
-
-        for col_name, width in {"사업자등록번호": 16, "URL": 53}.items():
-            if col_name in df_base.columns:
-                idx = df_base.columns.get_loc(col_name)
-                ws_base.set_column(idx, idx, width)
+        if highlight:
+            hl_col_idx = df_base.columns.get_loc("_hl")
+            hl_col_letter = xl_col_to_name(hl_col_idx)
+            ws_base.set_column(hl_col_idx, hl_col_idx, None, None, {"hidden": True})
 
-        if not check_list.empty and "회사명" in check_list.columns and "회사명" in df_base.columns:
-            chk_col_idx = check_list.columns.get_loc("회사명")
-            chk_col_letter = xl_col_to_name(chk_col_idx)
-            chk_last_row = len(check_list) + 1
-            chk_range = f"'검토목록'!${chk_col_letter}$2:${chk_col_letter}${chk_last_row}"
-
-            name_col_idx = df_base.columns.get_loc("회사명")
-            name_col_letter = xl_col_to_name(name_col_idx)
             last_row = len(df_base)
-            last_col = len(df_base.columns) - 1
-
             if last_row >= 1:
-                formula = f'=ISNUMBER(MATCH(${name_col_letter}2,{chk_range},0))'
                 ws_base.conditional_format(
                     1,
                     0,
                     last_row,
-                    last_col,
+                    hl_col_idx - 1,
                     {
                         "type": "formula",
-                        "criteria": formula,
+                        "criteria": f"=${hl_col_letter}2=TRUE",
                         "format": highlight_fmt,
                     },
                 )
@@ -547,19 +605,24 @@ def _write_excel(file_obj, check_list: pd.DataFrame, df_base: pd.DataFrame):
         ws_check.hide()
 
 
-def run_rights_issue_report(
+def rights_issue_report_filename(bgn_de: str, end_de: str) -> str:
+    kst_now = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%y%m%d_%H%M")
+    return f"DART_증권신고서_지분증권_F{bgn_de}_T{end_de}_추출시간_{kst_now}.xlsx"
+
+
+def _collect_rights_issue_frames(
     api_key: str,
     bgn_de: str,
     end_de: str,
-    out_dir: str | Path = "results",
-    report_name: str = REPORT_NAME_DEFAULT,
-    report_filter_text: str | None = None,
-    page_count: int = 100,
-    list_timeout: int = 60,
-    request_timeout: int = 30,
-    sleep_sec: float = 0.05,
-    verify_ssl: bool = False,
-) -> str | None:
+    report_name: str,
+    report_filter_text: str | None,
+    page_count: int,
+    list_timeout: int,
+    request_timeout: int,
+    max_workers: int,
+    verify_ssl: bool,
+    refresh: bool,
+) -> tuple[pd.DataFrame, pd.DataFrame] | None:
     report_df = _build_report_df(
         api_key=api_key,
         bgn_de=bgn_de,
@@ -580,62 +643,85 @@ def run_rights_issue_report(
         bgn_de=bgn_de,
         end_de=end_de,
         request_timeout=request_timeout,
-        sleep_sec=sleep_sec,
+        max_workers=max_workers,
         verify_ssl=verify_ssl,
+        refresh=refresh,
     )
     if df_base.empty:
         return None
 
-    out_dir = Path(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    kst_now = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%y%m%d_%H%M")
-    out_path = out_dir / f"DART_증권신고서_지분증권_F{bgn_de}_T{end_de}_추출시간_{kst_now}.xlsx"
-
-    _write_excel(out_path, check_list, df_base)
-    return str(out_path)
+    return check_list, df_base
 
 
-def run_rights_issue_report_bytes(
+def run_rights_issue_report(
     api_key: str,
     bgn_de: str,
     end_de: str,
+    out_dir: str | Path = "results",
     report_name: str = REPORT_NAME_DEFAULT,
     report_filter_text: str | None = None,
     page_count: int = 100,
     list_timeout: int = 60,
     request_timeout: int = 30,
-    sleep_sec: float = 0.05,
+    max_workers: int = MAX_WORKERS,
     verify_ssl: bool = False,
-) -> tuple[bytes, str] | None:
-    report_df = _build_report_df(
+    refresh: bool = False,
+) -> str | None:
+    frames = _collect_rights_issue_frames(
         api_key=api_key,
         bgn_de=bgn_de,
         end_de=end_de,
         report_name=report_name,
         report_filter_text=report_filter_text,
         page_count=page_count,
-        timeout=list_timeout,
+        list_timeout=list_timeout,
+        request_timeout=request_timeout,
+        max_workers=max_workers,
         verify_ssl=verify_ssl,
+        refresh=refresh,
     )
-    if report_df.empty:
+    if frames is None:
         return None
 
-    check_list = _build_check_list(report_df)
-    df_base = _build_general_sheet_df(
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / rights_issue_report_filename(bgn_de, end_de)
+
+    _write_excel(out_path, *frames)
+    return str(out_path)
+
+
+def run_rights_issue_report_bytes(
+    api_key: str,
+    bgn_de: str,
+    end_de: str,
+    report_name: str = REPORT_NAME_DEFAULT,
+    report_filter_text: str | None = None,
+    page_count: int = 100,
+    list_timeout: int = 60,
+    request_timeout: int = 30,
+    max_workers: int = MAX_WORKERS,
+    verify_ssl: bool = False,
+    refresh: bool = False,
+) -> tuple[bytes, str] | None:
+    frames = _collect_rights_issue_frames(
         api_key=api_key,
-        report_df=report_df,
         bgn_de=bgn_de,
         end_de=end_de,
+        report_name=report_name,
+        report_filter_text=report_filter_text,
+        page_count=page_count,
+        list_timeout=list_timeout,
         request_timeout=request_timeout,
-        sleep_sec=sleep_sec,
+        max_workers=max_workers,
         verify_ssl=verify_ssl,
+        refresh=refresh,
     )
-    if df_base.empty:
+    if frames is None:
         return None
 
-    kst_now = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%y%m%d_%H%M")
-    filename = f"DART_증권신고서_지분증권_F{bgn_de}_T{end_de}_추출시간_{kst_now}.xlsx"
+    filename = rights_issue_report_filename(bgn_de, end_de)
 
     buffer = BytesIO()
-    _write_excel(buffer, check_list, df_base)
+    _write_excel(buffer, *frames)
     return buffer.getvalue(), filename